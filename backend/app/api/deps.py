@@ -1,21 +1,42 @@
-from fastapi import Depends, HTTPException, status  
+from typing import Optional
+
+from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
-from app.models.user import User
 from jose import jwt, JWTError
 from app.core.config import settings
+from app.core.principal_cache import Principal, principal_cache
+from app.db.session import get_session
+from app.models.employee import Employee
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-def get_db() -> Session:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+def principal_from_employee(employee: Employee) -> Principal:
+    return Principal(
+        id=employee.id,
+        account=employee.account,
+        name=employee.name,
+        department_id=employee.department_id,
+        position_id=employee.position_id,
+        status=employee.status,
+        token_version=employee.token_version or 0,
+    )
+
+
+def load_principal(user_id: int, token_version: int) -> Optional[Principal]:
+    """Đọc user từ DB khi cache miss; None nếu không tồn tại/bị khóa/token đã bị thu hồi."""
+    with get_session() as db:
+        employee = db.query(Employee).filter(Employee.id == user_id).first()
+        if employee is None or employee.status != "active":
+            return None
+        if (employee.token_version or 0) != token_version:
+            return None
+        principal = principal_from_employee(employee)
+    principal_cache.set(principal)
+    return principal
+
+
+def get_current_user(token: str = Depends(oauth2_scheme)) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Không thể xác thực người dùng",
@@ -23,13 +44,15 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     )
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+        user_id = int(payload.get("sub"))
+        token_version = int(payload.get("ver", 0))
+    except (JWTError, TypeError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    # Cache hit: không cần truy vấn DB cho mỗi request
+    user = principal_cache.get(user_id, token_version)
+    if user is None:
+        user = load_principal(user_id, token_version)
     if user is None:
         raise credentials_exception
     return user
@@ -1,15 +1,33 @@
-"""Versioned API routers."""
+"""Versioned API routers.
 
-from . import department as departments
-from . import positions
-from . import employees
-from . import work_sessions
-from . import salaries
+Các module router được import khi truy cập lần đầu (PEP 562) để việc import
+package không kéo theo toàn bộ models, schemas và SQLAlchemy.
+"""
+
+from importlib import import_module
+
+_MODULES = {
+    "auth": "auth",
+    "departments": "department",
+    "positions": "positions",
+    "employees": "employees",
+    "work_sessions": "work_sessions",
+    "salaries": "salaries",
+}
 
 __all__ = [
+    "auth",
     "departments",
     "positions",
     "employees",
     "work_sessions",
     "salaries",
 ]
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        module = import_module(f".{_MODULES[name]}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
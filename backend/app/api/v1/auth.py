@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.orm import Session
+from app.api.deps import get_current_user, principal_from_employee
+from app.core.principal_cache import Principal, principal_cache
+from app.core.security import create_access_token, verify_password
+from app.db.session import get_db
+from app.models.employee import Employee
+from app.schemas.auth import PrincipalOut, Token
+
+router = APIRouter()
+
+# Đăng nhập bằng tài khoản nhân viên, trả về JWT
+# (handler đồng bộ nên bcrypt chạy trong threadpool, không chặn event loop)
+@router.post("/login", response_model=Token)
+def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    employee = db.query(Employee).filter(Employee.account == form.username).first()
+    valid, new_hash = verify_password(form.password, employee.password_hash if employee else None)
+    if not employee or not valid or employee.status != "active":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Sai tài khoản hoặc mật khẩu",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Nâng cấp mật khẩu cũ (chưa băm hoặc hash lỗi thời)
+    if new_hash:
+        employee.password_hash = new_hash
+        db.commit()
+        db.refresh(employee)
+
+    principal_cache.set(principal_from_employee(employee))
+    return Token(access_token=create_access_token(employee.id, employee.token_version or 0))
+
+# Thông tin người dùng hiện tại
+@router.get("/me", response_model=PrincipalOut)
+def read_current_user(current_user: Principal = Depends(get_current_user)):
+    return current_user
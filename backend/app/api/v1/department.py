@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from app.core.coalesce import coalesced
 from app.db.session import get_db
 from app.models.department import Department
 from app.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentOut
@@ -8,6 +9,7 @@ router = APIRouter()
 
 # API lấy danh sách phòng ban
 @router.get("/", response_model=list[DepartmentOut])
+@coalesced("departments:list", list[DepartmentOut], tables=("departments",))
 def get_departments(db: Session = Depends(get_db)):
     return db.query(Department).all()
 
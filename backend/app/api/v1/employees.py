@@ -1,5 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session, joinedload
+from app.core.coalesce import coalesced
+from app.core.principal_cache import principal_cache
+from app.core.security import hash_password
 from app.db.session import get_db
 from app.models.employee import Employee
 from app.schemas.employee import EmployeeCreate, EmployeeOut, EmployeeUpdate
@@ -23,13 +26,13 @@ def serialize_employee(employee: Employee) -> EmployeeOut:
         joined_at=employee.joined_at,
         photo_url=employee.photo_url,
         account=employee.account,
-        password_hash=employee.password_hash,
         created_at=employee.created_at,
         updated_at=employee.updated_at,
     )
 
 
 @router.get("/", response_model=list[EmployeeOut])
+@coalesced("employees:list", list[EmployeeOut], tables=("employees", "departments", "positions"))
 def list_employees(db: Session = Depends(get_db)):
     employees = (
         db.query(Employee)
@@ -68,7 +71,7 @@ def create_employee(employee: EmployeeCreate, db: Session = Depends(get_db)):
         status=employee.status,
         join_order=join_order,
         account=employee.account,
-        password_hash=employee.password,
+        password_hash=hash_password(employee.password),
         photo_url=employee.photo_url,
     )
 
@@ -96,21 +99,29 @@ def update_employee(
             db_employee.department_id = new_dept_id
             db_employee.position_id = new_pos_id
 
+    # Đổi tài khoản/mật khẩu/trạng thái thì thu hồi các token đã cấp
+    revoke_tokens = False
     if payload.name is not None:
         db_employee.name = payload.name
     if payload.base_salary is not None:
         db_employee.base_salary = payload.base_salary
     if payload.status is not None:
+        revoke_tokens |= payload.status != db_employee.status
         db_employee.status = payload.status
     if payload.account is not None:
+        revoke_tokens |= payload.account != db_employee.account
         db_employee.account = payload.account
     if payload.password is not None:
-        db_employee.password_hash = payload.password
+        db_employee.password_hash = hash_password(payload.password)
+        revoke_tokens = True
     if payload.photo_url is not None:
         db_employee.photo_url = payload.photo_url
+    if revoke_tokens:
+        db_employee.token_version = (db_employee.token_version or 0) + 1
 
     db.commit()
     db.refresh(db_employee)
+    principal_cache.invalidate(employee_id)
     return serialize_employee(db_employee)
 
 
@@ -122,4 +133,5 @@ def delete_employee(employee_id: int, db: Session = Depends(get_db)):
 
     db.delete(db_employee)
     db.commit()
+    principal_cache.invalidate(employee_id)
     return {"detail": "Employee deleted successfully"}
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from app.core.coalesce import coalesced
 from app.db.session import get_db
 from app.models.position import Position
 from app.schemas.position import PositionCreate, PositionUpdate, PositionOut
@@ -8,6 +9,7 @@ router = APIRouter()
 
 # Lấy danh sách chức vụ
 @router.get("/", response_model=list[PositionOut])
+@coalesced("positions:list", list[PositionOut], tables=("positions",))
 def get_positions(db: Session = Depends(get_db)):
     return db.query(Position).all()
 
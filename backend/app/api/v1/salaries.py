@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from app.core.coalesce import coalesced
 from app.db.session import get_db
 from app.models.salary import Salary
 from app.schemas.salary import SalaryOut, SalaryCreate
+from app.schemas.payroll_simulation import PayrollSimulationOut, PayrollSimulationRequest
 from app.services.salary_calculator import calculate_salary_for_employee
+from app.services.payroll_simulation import simulate_payroll
 from datetime import datetime
 from app.models.employee import Employee
 
@@ -26,8 +29,14 @@ def calculate_salary(
     salary = calculate_salary_for_employee(db, employee, year, month)
     return salary
 
+# Mô phỏng bảng lương toàn công ty theo quy tắc tùy chọn (không lưu vào database)
+@router.post("/simulate", response_model=PayrollSimulationOut)
+def simulate_salaries(payload: PayrollSimulationRequest, db: Session = Depends(get_db)):
+    return simulate_payroll(db, payload.year, payload.month, payload.rules)
+
 # Lấy lương tháng của nhân viên
 @router.get("/{employee_id}/{year}/{month}", response_model=SalaryOut)
+@coalesced("salaries:get", SalaryOut, tables=("monthly_salaries",))
 def get_salary(employee_id: int, year: int, month: int, db: Session = Depends(get_db)):
     salary = db.query(Salary).filter(
         Salary.employee_id == employee_id,
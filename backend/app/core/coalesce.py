@@ -0,0 +1,207 @@
+"""Single-flight request coalescing for expensive read endpoints.
+
+Các request đồng thời giống nhau (cùng route, cùng tham số, cùng phiên bản dữ
+liệu) chỉ chạy handler một lần và dùng chung response đã serialize. Có thể bật
+thêm cache ngắn hạn (LRU + TTL) cho cùng khóa qua ``COALESCE_CACHE_TTL_SECONDS``
+(mặc định tắt). Phiên bản dữ liệu của mỗi bảng tăng sau mỗi commit có thay đổi
+bảng đó trong *cùng tiến trình*; với nhiều worker, commit ở worker khác không
+làm mất hiệu lực cache ở đây, nên response cũ có thể tồn tại tối đa bằng TTL.
+"""
+
+import asyncio
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from fastapi import BackgroundTasks, Request
+from fastapi import params as fastapi_params
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import parse_obj_as
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+_CHANGED_TABLES_KEY = "coalesce_changed_tables"
+
+
+class DataVersions:
+    """Bộ đếm phiên bản theo bảng, tăng khi có commit thay đổi bảng đó."""
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def bump(self, tables) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def current(self, tables) -> tuple[int, ...]:
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+
+data_versions = DataVersions()
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    changed = session.info.setdefault(_CHANGED_TABLES_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            changed.add(table.name)
+
+
+def _after_commit(session: Session) -> None:
+    changed = session.info.pop(_CHANGED_TABLES_KEY, None)
+    if changed:
+        data_versions.bump(changed)
+
+
+def _after_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_CHANGED_TABLES_KEY, None)
+
+
+event.listen(SessionLocal, "after_flush", _after_flush)
+event.listen(SessionLocal, "after_commit", _after_commit)
+event.listen(SessionLocal, "after_soft_rollback", _after_rollback)
+
+
+class SingleFlight:
+    """Chạy mỗi khóa tối đa một lần tại một thời điểm, kèm cache LRU/TTL tùy chọn.
+
+    Request đầu tiên của một khóa tạo task chạy ``fn`` trong threadpool; các
+    request trùng khóa chỉ ``await`` task đó trên event loop nên không chiếm
+    thread nào trong lúc chờ. Task được ``shield``: request tạo ra nó bị hủy
+    (client ngắt kết nối) thì các request khác vẫn nhận được kết quả.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._calls: dict[Any, "asyncio.Task[bytes]"] = {}
+        self._cache: "OrderedDict[Any, tuple[float, bytes]]" = OrderedDict()
+        self.requests = 0
+        self.hits = 0
+        self.coalesced = 0
+
+    async def do(self, key: Any, fn: Callable[[], bytes], ttl: float = 0) -> bytes:
+        with self._lock:
+            self.requests += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return cached[1]
+                del self._cache[key]
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = asyncio.ensure_future(self._execute(key, fn, ttl))
+                # Tránh cảnh báo "exception was never retrieved" khi mọi request đã bị hủy
+                call.add_done_callback(lambda task: task.cancelled() or task.exception())
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(call)
+
+    async def _execute(self, key: Any, fn: Callable[[], bytes], ttl: float) -> bytes:
+        try:
+            body = await run_in_threadpool(fn)
+        except BaseException:
+            with self._lock:
+                del self._calls[key]
+            raise
+        with self._lock:
+            del self._calls[key]
+            if ttl > 0:
+                self._cache[key] = (time.monotonic() + ttl, body)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return body
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            requests = self.requests
+            return {
+                "requests": requests,
+                "cache_hits": self.hits,
+                "coalesced": self.coalesced,
+                "executions": requests - self.hits - self.coalesced,
+                "in_flight": len(self._calls),
+                "cached_keys": len(self._cache),
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "coalesce_rate": self.coalesced / requests if requests else 0.0,
+            }
+
+
+single_flight = SingleFlight()
+
+
+# Tham số FastAPI tự truyền vào, không phải dữ liệu của request
+_INJECTED_TYPES = (Request, Response, BackgroundTasks)
+
+
+def _key_param_names(func) -> tuple[str, ...]:
+    """Tên các tham số của handler, trừ dependency (``Depends``/``Security``)."""
+    names = []
+    for name, param in inspect.signature(func).parameters.items():
+        if isinstance(param.default, fastapi_params.Depends):
+            continue
+        annotation = param.annotation
+        if isinstance(annotation, type) and issubclass(annotation, _INJECTED_TYPES):
+            continue
+        names.append(name)
+    return tuple(names)
+
+
+def _normalize_params(name: str, kwargs: dict[str, Any], key_params: tuple[str, ...]) -> str:
+    try:
+        return json.dumps(
+            jsonable_encoder({k: kwargs.get(k) for k in key_params}),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+    except (TypeError, ValueError) as exc:
+        raise TypeError(f"Cannot build coalescing key for {name!r}: {exc}") from exc
+
+
+def coalesced(
+    name: str, response_model: Any, tables: tuple[str, ...], ttl: Optional[float] = None
+):
+    """Decorator cho route handler đồng bộ; route nhận được là hàm ``async``.
+
+    Handler chỉ chạy trong threadpool ở request dẫn đầu của mỗi khóa.
+    ``response_model`` dùng để serialize kết quả một lần cho mọi request dùng
+    chung; ``tables`` là các bảng mà response phụ thuộc (quyết định phiên bản
+    dữ liệu trong khóa); ``ttl`` mặc định lấy từ ``COALESCE_CACHE_TTL_SECONDS``.
+    Mọi tham số không phải dependency đều được đưa vào khóa sau khi chuẩn hóa
+    bằng ``jsonable_encoder``; tham số không chuẩn hóa được gây ``TypeError``.
+    """
+
+    def decorator(func):
+        key_params = _key_param_names(func)
+
+        @wraps(func)
+        async def wrapper(**kwargs):
+            params = _normalize_params(name, kwargs, key_params)
+            key = (name, params, data_versions.current(tables))
+
+            def compute() -> bytes:
+                result = func(**kwargs)
+                content = jsonable_encoder(parse_obj_as(response_model, result))
+                return JSONResponse(content).body
+
+            cache_ttl = settings.COALESCE_CACHE_TTL_SECONDS if ttl is None else ttl
+            body = await single_flight.do(key, compute, cache_ttl)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,34 @@
 from pydantic import BaseSettings
 
 class Settings(BaseSettings):
+    DATABASE_URL: str = ""
     SUPABASE_URL: str = ""
     SUPABASE_ANON_KEY: str = ""
+    SUPABASE_TIMEOUT_SECONDS: float = 10
+    SUPABASE_MAX_CONNECTIONS: int = 20  # Kích thước pool keep-alive của gateway
+    SUPABASE_RETRIES: int = 2  # Số lần thử lại với lỗi mạng/5xx/429
+    SUPABASE_BATCH_WINDOW_MS: float = 2  # Thời gian gom các truy vấn theo khóa thành một request
+    # Cache ngắn hạn cho endpoint đọc dùng chung (0 = tắt, mặc định). Phiên bản dữ
+    # liệu chỉ theo dõi commit trong cùng tiến trình: khi chạy nhiều worker, ghi ở
+    # worker này có thể để response cũ ở worker khác tồn tại tối đa bằng TTL.
+    COALESCE_CACHE_TTL_SECONDS: float = 0
     JWT_SECRET_KEY: str = "CHANGE_ME"  # Secret key cho JWT
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    AUTH_CACHE_MAXSIZE: int = 10000  # Số principal tối đa giữ trong bộ nhớ
+    # Thời gian sống của principal trong cache. Khi khóa/đổi mật khẩu một tài
+    # khoản, cache của worker xử lý request được xóa ngay, nhưng các worker khác
+    # vẫn chấp nhận token cũ tối đa bằng TTL này (cửa sổ thu hồi giữa các worker).
+    AUTH_CACHE_TTL_SECONDS: float = 30
+    LAZY_ROUTERS: bool = True  # Chỉ import router khi có request đầu tiên tới prefix của nó
+    WARM_UP_ON_STARTUP: bool = False  # Mở sẵn kết nối DB và nạp router trong startup hook
+    AUDIT_ENABLED: bool = True
+    AUDIT_BATCH_SIZE: int = 500  # Số nhật ký tối đa mỗi lần ghi
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0  # Chu kỳ ghi tối đa
+    AUDIT_QUEUE_MAXSIZE: int = 10000  # Hàng đợi đầy thì request phải chờ (backpressure)
+    AUDIT_SUBMIT_TIMEOUT_SECONDS: float = 0.1  # Chờ tối đa khi hàng đợi đầy, quá hạn thì bỏ nhật ký
+    AUDIT_MAX_RETRIES: int = 3  # Số lần thử lại một lô trước khi chuyển vào dead-letter log
+    AUDIT_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0  # Chờ ghi nốt khi tắt, quá hạn thì chuyển vào dead-letter log
 
     class Config:
         env_file = ".env"
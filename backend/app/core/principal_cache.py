@@ -0,0 +1,73 @@
+"""In-memory LRU/TTL cache of authenticated principals."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Thông tin người dùng đã xác thực, không gắn với session DB."""
+
+    id: int
+    account: str
+    name: str
+    department_id: int
+    position_id: int
+    status: str
+    token_version: int
+
+
+class PrincipalCache:
+    """Cache theo khóa ``(user_id, token_version)``.
+
+    Khi tài khoản hoặc mật khẩu thay đổi, ``token_version`` tăng nên token cũ
+    không còn khớp khóa; ``invalidate`` xóa ngay các bản ghi của user đó trong
+    tiến trình hiện tại, TTL giới hạn độ trễ ở các worker khác.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[tuple[int, int], tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, token_version: int) -> Optional[Principal]:
+        key = (user_id, token_version)
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= now:
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, principal: Principal) -> None:
+        key = (principal.id, principal.token_version)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, principal)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            for key in [k for k in self._data if k[0] == user_id]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+principal_cache = PrincipalCache(settings.AUTH_CACHE_MAXSIZE, settings.AUTH_CACHE_TTL_SECONDS)
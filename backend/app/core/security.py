@@ -0,0 +1,50 @@
+"""Password hashing and JWT helpers."""
+
+import hmac
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Optional
+
+from jose import jwt
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@lru_cache()
+def _dummy_hash() -> str:
+    """Hash giả dùng khi không tìm thấy tài khoản để thời gian phản hồi không lộ thông tin."""
+    return pwd_context.hash("dummy-password")
+
+
+def hash_password(password: str) -> str:
+    """Băm mật khẩu bằng bcrypt.
+
+    Tốn CPU: chỉ gọi từ handler đồng bộ (FastAPI chạy trong threadpool) hoặc
+    qua ``run_in_threadpool``, không gọi trực tiếp trong event loop.
+    """
+    return pwd_context.hash(password)
+
+
+def verify_password(password: str, password_hash: Optional[str]) -> tuple[bool, Optional[str]]:
+    """Kiểm tra mật khẩu, trả về ``(hợp lệ, hash mới nếu cần cập nhật)``.
+
+    Bản ghi cũ lưu mật khẩu dạng thô được chấp nhận một lần và trả về hash
+    bcrypt để lưu lại.
+    """
+    if not password_hash:
+        pwd_context.verify(password, _dummy_hash())
+        return False, None
+    if pwd_context.identify(password_hash) is None:
+        if hmac.compare_digest(password.encode(), password_hash.encode()):
+            return True, hash_password(password)
+        return False, None
+    return pwd_context.verify_and_update(password, password_hash)
+
+
+def create_access_token(subject: Any, token_version: int) -> str:
+    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    payload = {"sub": str(subject), "ver": token_version, "exp": expire}
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
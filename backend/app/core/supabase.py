@@ -1,21 +1,25 @@
 """Supabase client helpers."""
 
 from functools import lru_cache
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
 from fastapi import HTTPException
-from supabase import Client, create_client
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 
 class SupabaseConfigurationError(RuntimeError):
     """Raised when Supabase credentials are missing."""
 
 
 @lru_cache()
-def get_supabase_client() -> Client:
+def get_supabase_client() -> "Client":
     """Return a shared Supabase client instance."""
+    from supabase import create_client
+
     if not settings.SUPABASE_URL or not settings.SUPABASE_ANON_KEY:
         raise SupabaseConfigurationError(
             "Supabase credentials are not configured. "
@@ -31,7 +35,9 @@ def ensure_data(response: Any) -> list[dict[str, Any]]:
         message = getattr(error, "message", str(error))
         raise HTTPException(status_code=500, detail=f"Supabase error: {message}")
     data = getattr(response, "data", None) or []
-    if isinstance(data, Iterable):
+    if isinstance(data, list):
+        return data
+    if isinstance(data, Iterable) and not isinstance(data, (dict, str, bytes)):
         return list(data)
     return [data]
 
@@ -0,0 +1,211 @@
+"""Async gateway to Supabase/PostgREST.
+
+Dùng một ``httpx.AsyncClient`` chung (pool keep-alive) thay cho client đồng bộ
+của ``get_supabase_client``. Các lần đọc theo khóa (``get_row``) đến trong cùng
+một khoảng ngắn được gom thành một truy vấn ``column=in.(...)``.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.supabase import SupabaseConfigurationError
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Ký tự cần đặt trong dấu nháy kép khi dùng trong bộ lọc in.(...) của PostgREST
+_RESERVED = set(',.:()" \\')
+
+
+def _format_in(values) -> str:
+    parts = []
+    for value in values:
+        text = str(value)
+        if any(ch in _RESERVED for ch in text):
+            text = '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        parts.append(text)
+    return f"in.({','.join(parts)})"
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        return response.json().get("message", response.text)
+    except (ValueError, AttributeError):
+        return response.text
+
+
+class _RowBatcher:
+    """Gom các ``get_row`` cùng bảng/cột/select thành một request."""
+
+    def __init__(self, gateway: "SupabaseGateway", table: str, column: str, columns: str):
+        self.gateway = gateway
+        self.table = table
+        self.column = column
+        self.columns = columns
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    async def load(self, key: Any) -> Optional[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(str(key), []).append(future)
+        if len(self._pending) >= self.gateway.max_batch_size:
+            self._flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.gateway.batch_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self.gateway._tasks.add(task)
+            task.add_done_callback(self.gateway._tasks.discard)
+
+    async def _dispatch(self, batch: dict[str, list[asyncio.Future]]) -> None:
+        try:
+            rows = await self.gateway.select(
+                self.table, columns=self.columns, filters={self.column: _format_in(batch)}
+            )
+        except Exception as exc:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        by_key = {str(row.get(self.column)): row for row in rows}
+        for key, futures in batch.items():
+            row = by_key.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(row)
+
+
+class SupabaseGateway:
+    """Client bất đồng bộ cho PostgREST với pool, timeout, retry và gom request."""
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        timeout: float = 10,
+        max_connections: int = 20,
+        retries: int = 2,
+        batch_window: float = 0.002,
+        max_batch_size: int = 100,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.retries = retries
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.request_count = 0
+        self._batchers: dict[tuple[str, str, str], _RowBatcher] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._client = httpx.AsyncClient(
+            base_url=url.rstrip("/") + "/rest/v1",
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        # Chỉ thử lại request idempotent để không ghi trùng dữ liệu
+        retries = self.retries if method in ("GET", "HEAD") else 0
+        error = ""
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(0.05 * 2 ** (attempt - 1))
+            self.request_count += 1
+            try:
+                response = await self._client.request(method, path, **kwargs)
+            except httpx.TransportError as exc:
+                error = repr(exc)
+                continue
+            if response.status_code in RETRY_STATUSES:
+                error = _error_message(response)
+                continue
+            if response.is_error:
+                raise HTTPException(
+                    status_code=500, detail=f"Supabase error: {_error_message(response)}"
+                )
+            return response.json() if response.content else []
+        raise HTTPException(status_code=500, detail=f"Supabase error: {error}")
+
+    async def select(
+        self,
+        table: str,
+        columns: str = "*",
+        filters: Optional[dict[str, str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Đọc nhiều dòng; ``filters`` theo cú pháp PostgREST, ví dụ ``{"id": "eq.1"}``."""
+        params = {"select": columns, **(filters or {})}
+        if limit is not None:
+            params["limit"] = str(limit)
+        return await self._request("GET", f"/{table}", params=params)
+
+    async def get_row(
+        self, table: str, key: Any, column: str = "id", columns: str = "*"
+    ) -> Optional[dict[str, Any]]:
+        """Đọc một dòng theo khóa; các lời gọi đồng thời được gom thành một request."""
+        if columns != "*" and column not in columns.split(","):
+            columns = f"{columns},{column}"
+        batcher_key = (table, column, columns)
+        batcher = self._batchers.get(batcher_key)
+        if batcher is None:
+            batcher = self._batchers[batcher_key] = _RowBatcher(self, table, column, columns)
+        return await batcher.load(key)
+
+    async def get_rows(
+        self, table: str, keys, column: str = "id", columns: str = "*"
+    ) -> list[Optional[dict[str, Any]]]:
+        return await asyncio.gather(*(self.get_row(table, k, column, columns) for k in keys))
+
+    async def insert(self, table: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return await self._request(
+            "POST", f"/{table}", json=rows, headers={"Prefer": "return=representation"}
+        )
+
+
+_gateway: Optional[SupabaseGateway] = None
+
+
+def get_supabase_gateway() -> SupabaseGateway:
+    """Return the shared gateway, created on first use."""
+    global _gateway
+    if _gateway is None:
+        if not settings.SUPABASE_URL or not settings.SUPABASE_ANON_KEY:
+            raise SupabaseConfigurationError(
+                "Supabase credentials are not configured. "
+                "Set SUPABASE_URL and SUPABASE_ANON_KEY in the environment."
+            )
+        _gateway = SupabaseGateway(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_ANON_KEY,
+            timeout=settings.SUPABASE_TIMEOUT_SECONDS,
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            retries=settings.SUPABASE_RETRIES,
+            batch_window=settings.SUPABASE_BATCH_WINDOW_MS / 1000,
+        )
+    return _gateway
+
+
+async def close_supabase_gateway() -> None:
+    global _gateway
+    if _gateway is not None:
+        await _gateway.aclose()
+        _gateway = None
@@ -0,0 +1,29 @@
+"""Hàm SQL tùy chỉnh, biên dịch riêng cho từng dialect."""
+
+from sqlalchemy import Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class seconds_between(FunctionElement):
+    """Số giây nguyên giữa hai mốc thời gian (``end - start``)."""
+
+    type = Integer()
+    inherit_cache = True
+    name = "seconds_between"
+
+
+@compiles(seconds_between, "mysql")
+def _seconds_between_mysql(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return f"TIMESTAMPDIFF(SECOND, {compiler.process(start, **kw)}, {compiler.process(end, **kw)})"
+
+
+@compiles(seconds_between, "sqlite")
+def _seconds_between_sqlite(element, compiler, **kw):
+    # Dùng cho benchmark/thử nghiệm trên SQLite
+    start, end = list(element.clauses)
+    return (
+        f"CAST(ROUND((julianday({compiler.process(end, **kw)}) - "
+        f"julianday({compiler.process(start, **kw)})) * 86400) AS INTEGER)"
+    )
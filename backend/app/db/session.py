@@ -1,17 +1,31 @@
+from functools import lru_cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Engine kết nối MySQL
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+# Session factory (engine được gắn vào khi dùng lần đầu, xem get_engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+@lru_cache()
+def get_engine() -> Engine:
+    """Tạo engine kết nối MySQL ở lần gọi đầu tiên thay vì lúc import."""
+    engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+    SessionLocal.configure(bind=engine)
+    return engine
+
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_session():
+    """Mở session mới (đảm bảo engine đã được tạo)."""
+    get_engine()
+    return SessionLocal()
 
 
 def get_db():
     """Dependency cung cấp session theo yêu cầu cho FastAPI."""
-    db = SessionLocal()
+    db = get_session()
     try:
         yield db
     finally:
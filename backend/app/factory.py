@@ -0,0 +1,168 @@
+"""Application factory với khởi động nhanh (cold start).
+
+Router chỉ được import khi có request đầu tiên tới prefix của nó, engine DB
+được tạo khi cần session lần đầu. Startup hook tùy chọn mở sẵn kết nối và nạp
+toàn bộ router để request đầu tiên không phải chịu chi phí đó; audit log
+(app/services/audit.py) được khởi động/ghi nốt trong startup/shutdown hook.
+"""
+
+import sys
+import threading
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Optional
+
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    module: str
+    prefix: str
+    tags: tuple[str, ...]
+
+
+ROUTERS = (
+    RouterSpec("app.api.v1.auth", "/api/v1/auth", ("Auth",)),
+    RouterSpec("app.api.v1.department", "/api/v1/departments", ("Departments",)),
+    RouterSpec("app.api.v1.positions", "/api/v1/positions", ("Positions",)),
+    RouterSpec("app.api.v1.employees", "/api/v1/employees", ("Employees",)),
+    RouterSpec("app.api.v1.work_sessions", "/api/v1/work_sessions", ("Work Sessions",)),
+    RouterSpec("app.api.v1.salaries", "/api/v1/salaries", ("Salaries",)),
+)
+
+
+class RouterRegistry:
+    """Đăng ký router vào app, mỗi router đúng một lần (an toàn giữa các thread)."""
+
+    def __init__(self, app: FastAPI, specs: tuple[RouterSpec, ...] = ROUTERS):
+        self.app = app
+        self.specs = specs
+        self._loaded: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> bool:
+        return len(self._loaded) < len(self.specs)
+
+    def include(self, spec: RouterSpec) -> None:
+        if spec.module in self._loaded:
+            return
+        with self._lock:
+            if spec.module in self._loaded:
+                return
+            router = import_module(spec.module).router
+            self.app.include_router(router, prefix=spec.prefix, tags=list(spec.tags))
+            # Schema OpenAPI có thể đã được sinh trước đó với danh sách route cũ
+            self.app.openapi_schema = None
+            self._loaded.add(spec.module)
+
+    def include_all(self) -> None:
+        for spec in self.specs:
+            self.include(spec)
+
+    def include_for_path(self, path: str) -> None:
+        for spec in self.specs:
+            if path == spec.prefix or path.startswith(spec.prefix + "/"):
+                self.include(spec)
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware nạp router tương ứng trước khi request được định tuyến."""
+
+    def __init__(self, app: ASGIApp, registry: RouterRegistry):
+        self.app = app
+        self.registry = registry
+        # Những đường dẫn cần thấy toàn bộ route (tài liệu API)
+        self.full_paths = {
+            p for p in (registry.app.openapi_url, registry.app.docs_url, registry.app.redoc_url) if p
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and self.registry.pending:
+            path = scope["path"]
+            if path in self.full_paths:
+                self.registry.include_all()
+            else:
+                self.registry.include_for_path(path)
+        await self.app(scope, receive, send)
+
+
+def warm_up(registry: RouterRegistry) -> None:
+    """Nạp toàn bộ router và mở sẵn một kết nối trong pool."""
+    registry.include_all()
+
+    from sqlalchemy import text
+
+    from app.db.session import get_engine
+
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def create_app(
+    lazy_routers: Optional[bool] = None, warm_up_on_startup: Optional[bool] = None
+) -> FastAPI:
+    """Tạo FastAPI app; mặc định lấy cấu hình từ ``settings``."""
+    if lazy_routers is None:
+        lazy_routers = settings.LAZY_ROUTERS
+    if warm_up_on_startup is None:
+        warm_up_on_startup = settings.WARM_UP_ON_STARTUP
+
+    app = FastAPI()
+    registry = RouterRegistry(app)
+    app.state.router_registry = registry
+
+    @app.get("/healthz", include_in_schema=False)
+    def healthz():
+        return {"status": "ok"}
+
+    @app.get("/metrics/coalescing", include_in_schema=False)
+    def coalescing_metrics():
+        from app.core.coalesce import single_flight
+
+        return single_flight.stats()
+
+    if lazy_routers:
+        app.add_middleware(LazyRouterMiddleware, registry=registry)
+    else:
+        registry.include_all()
+
+    if warm_up_on_startup:
+        @app.on_event("startup")
+        async def warm_up_hook():
+            await run_in_threadpool(warm_up, registry)
+
+    if settings.AUDIT_ENABLED:
+        @app.on_event("startup")
+        async def start_audit():
+            from app.db.session import SessionLocal
+            from app.services.audit import install_audit
+
+            install_audit(
+                SessionLocal,
+                batch_size=settings.AUDIT_BATCH_SIZE,
+                flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+                max_queue=settings.AUDIT_QUEUE_MAXSIZE,
+                submit_timeout=settings.AUDIT_SUBMIT_TIMEOUT_SECONDS,
+                max_retries=settings.AUDIT_MAX_RETRIES,
+            )
+
+        @app.on_event("shutdown")
+        async def stop_audit():
+            from app.services.audit import shutdown_audit
+
+            await run_in_threadpool(shutdown_audit, settings.AUDIT_SHUTDOWN_TIMEOUT_SECONDS)
+
+    @app.on_event("shutdown")
+    async def close_supabase():
+        # Chỉ đóng nếu gateway đã từng được dùng (không import httpx khi không cần)
+        gateway_module = sys.modules.get("app.core.supabase_gateway")
+        if gateway_module is not None:
+            await gateway_module.close_supabase_gateway()
+
+    return app
@@ -0,0 +1,16 @@
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Enum, Integer, String
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class AuditLog(Base):
+    __tablename__ = "audit_logs"
+
+    # SQLite chỉ tự tăng khóa chính kiểu INTEGER
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, index=True)
+    table_name = Column(String(64), nullable=False)  # Bảng bị thay đổi
+    row_id = Column(Integer, nullable=True)  # Khóa chính của dòng bị thay đổi
+    action = Column(Enum("create", "update", "delete", name="audit_action_enum"), nullable=False)
+    changes = Column(JSON, nullable=False)  # {"cột": {"before": ..., "after": ...}}
+    occurred_at = Column(DateTime, nullable=False)  # Thời điểm commit thay đổi
+    created_at = Column(DateTime, server_default=func.now())
@@ -20,6 +20,7 @@ class Employee(Base):
     photo_url = Column(String(255), nullable=True)  # Hình ảnh nhân viên
     account = Column(String(100), nullable=False)  # Tên tài khoản
     password_hash = Column(String(255), nullable=False)  # Mật khẩu (đã băm)
+    token_version = Column(Integer, nullable=False, default=0)  # Tăng khi đổi tài khoản/mật khẩu để thu hồi token
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Computed, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.db.functions import seconds_between
 
 
 class WorkSession(Base):
@@ -12,3 +13,11 @@ class WorkSession(Base):
     checkout = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Số giây làm việc, do database tự tính khi ghi (cột generated STORED).
+    # Để cuối bảng: SQLite chỉ dùng được index bao phủ khi cột generated nằm sau cùng.
+    worked_seconds = Column(Integer, Computed(seconds_between(checkin, checkout), persisted=True))
+
+    # Index bao phủ cho truy vấn tổng giờ theo tháng (mô phỏng bảng lương)
+    __table_args__ = (
+        Index("idx_work_sessions_checkin", "checkin", "employee_id", "checkout", "worked_seconds"),
+    )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+
+
+class PrincipalOut(BaseModel):
+    id: int
+    account: str
+    name: str
+    department_id: int
+    position_id: int
+    status: str
+
+    class Config:
+        orm_mode = True
@@ -45,7 +45,6 @@ class EmployeeOut(BaseModel):
     joined_at: datetime
     photo_url: Optional[str] = None
     account: str
-    password_hash: str
     created_at: datetime
     updated_at: datetime
 
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field, confloat
+
+
+class PayrollRuleSet(BaseModel):
+    """Bộ quy tắc tính lương dùng cho mô phỏng (mặc định giống quy tắc hiện hành)."""
+
+    overtime_threshold_hours: float = Field(40, gt=0)
+    # Số giờ chuẩn để quy đổi lương cơ bản ra lương giờ, độc lập với ngưỡng làm thêm
+    standard_hours: float = Field(40, gt=0)
+    overtime_multiplier: float = Field(1.5, ge=0)
+    # Hệ số điều chỉnh lương cơ bản theo phòng ban, ví dụ {3: 1.05} = tăng 5% cho phòng 3
+    department_base_salary_factors: dict[int, confloat(ge=0)] = Field(default_factory=dict)
+    include_inactive: bool = False
+
+
+class PayrollSimulationRequest(BaseModel):
+    year: int = Field(..., ge=1, lt=9999)
+    month: int = Field(..., ge=1, le=12)
+    rules: PayrollRuleSet = Field(default_factory=PayrollRuleSet)
+
+
+class PayrollGroupTotal(BaseModel):
+    id: int
+    name: Optional[str] = None
+    employee_count: int
+    total_hours: float
+    overtime_hours: float
+    base_salary: float
+    overtime_salary: float
+    total_salary: float
+
+
+class PayrollSimulationOut(BaseModel):
+    year: int
+    month: int
+    rules: PayrollRuleSet
+    employee_count: int
+    total_hours: float
+    overtime_hours: float
+    base_salary: float
+    overtime_salary: float
+    total_salary: float
+    by_department: list[PayrollGroupTotal]
+    by_position: list[PayrollGroupTotal]
@@ -0,0 +1,346 @@
+"""Nhật ký thay đổi (audit log) ghi trễ theo lô.
+
+Thay đổi trên các bảng nghiệp vụ được ghi nhận qua event của SQLAlchemy
+session (``after_flush``), chỉ đưa vào hàng đợi khi transaction commit thành
+công, rồi một thread nền ghi xuống bảng ``audit_logs`` theo lô (giới hạn bởi
+số lượng hoặc thời gian). Handler không phải chờ ghi nhật ký.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import event, insert, inspect
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+# Nhật ký không ghi được xuống database sau khi đã thử lại, dạng JSON mỗi dòng
+dead_letter_logger = logging.getLogger("app.audit.dead_letter")
+
+AUDITED_TABLES = frozenset(
+    {"departments", "positions", "employees", "work_sessions", "monthly_salaries"}
+)
+# Cột nhạy cảm: chỉ ghi nhận là có thay đổi, không lưu giá trị
+REDACTED_COLUMNS = frozenset({"password_hash"})
+REDACTED = "***"
+
+_PENDING_KEY = "audit_pending"
+# Lỗi do chính dữ liệu của một vài nhật ký: chỉ khi đó mới tách lô để ghi từng dòng
+_DATA_ERRORS = (IntegrityError, DataError)
+
+
+@dataclass
+class AuditEntry:
+    table_name: str
+    row_id: Optional[int]
+    action: str
+    changes: dict[str, dict[str, Any]]
+    occurred_at: datetime
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "table_name": self.table_name,
+            "row_id": self.row_id,
+            "action": self.action,
+            "changes": self.changes,
+            "occurred_at": self.occurred_at,
+        }
+
+
+def _log_dead_letter(entries: list[AuditEntry]) -> None:
+    for entry in entries:
+        dead_letter_logger.error(json.dumps(entry.as_row(), default=str))
+
+
+def _jsonable(column: str, value: Any) -> Any:
+    if column in REDACTED_COLUMNS and value is not None:
+        return REDACTED
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _row_id(state) -> Optional[int]:
+    # state.identity chưa có với bản ghi mới trong after_flush, đọc trực tiếp cột khóa chính
+    primary_key = state.mapper.primary_key
+    if len(primary_key) != 1:
+        return None
+    return state.dict.get(state.mapper.get_property_by_column(primary_key[0]).key)
+
+
+def _snapshot(state, key: str) -> dict[str, dict[str, Any]]:
+    """Giá trị các cột đã nạp của một object (dùng cho create/delete)."""
+    values = state.dict
+    return {
+        attr.key: {key: _jsonable(attr.key, values[attr.key])}
+        for attr in state.mapper.column_attrs
+        if attr.key in values
+    }
+
+
+def _diff(state) -> dict[str, dict[str, Any]]:
+    changes = {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        if not history.has_changes():
+            continue
+        before = history.deleted[0] if history.deleted else None
+        after = history.added[0] if history.added else None
+        changes[attr.key] = {
+            "before": _jsonable(attr.key, before),
+            "after": _jsonable(attr.key, after),
+        }
+    return changes
+
+
+def _is_audited(obj: Any) -> bool:
+    table = getattr(obj, "__table__", None)
+    return table is not None and table.name in AUDITED_TABLES
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    # Trong after_flush, session.new/dirty/deleted vẫn giữ trạng thái trước flush
+    # nhưng khóa chính của bản ghi mới đã được gán.
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    now = datetime.utcnow()
+    for obj in session.new:
+        if _is_audited(obj):
+            state = inspect(obj)
+            pending.append(
+                AuditEntry(obj.__table__.name, _row_id(state), "create", _snapshot(state, "after"), now)
+            )
+    for obj in session.dirty:
+        if _is_audited(obj):
+            state = inspect(obj)
+            changes = _diff(state)
+            if changes:
+                pending.append(AuditEntry(obj.__table__.name, _row_id(state), "update", changes, now))
+    for obj in session.deleted:
+        if _is_audited(obj):
+            state = inspect(obj)
+            pending.append(
+                AuditEntry(obj.__table__.name, _row_id(state), "delete", _snapshot(state, "before"), now)
+            )
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending and _writer is not None:
+        _writer.submit(pending)
+
+
+def _after_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+class AuditWriter:
+    """Thread nền gom các ``AuditEntry`` và ghi xuống database theo lô.
+
+    Hàng đợi có giới hạn: khi đầy, ``submit`` chờ tối đa ``submit_timeout``
+    giây (backpressure) rồi bỏ nhật ký, ghi chúng vào dead-letter log (logger
+    ``app.audit.dead_letter``) và đếm vào ``dropped`` thay vì chặn request.
+
+    Lô gặp lỗi dữ liệu (``IntegrityError``/``DataError``) được ghi riêng từng
+    nhật ký để tách nhật ký lỗi. Lỗi khác (mất kết nối, ``OperationalError``...)
+    được thử lại tối đa ``max_retries`` lần rồi chuyển cả lô vào dead-letter
+    log, không thử từng dòng. Nhật ký vào dead-letter log được đếm ở
+    ``dead_lettered``.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+        submit_timeout: float = 0.1,
+        max_retries: int = 3,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.submit_timeout = submit_timeout
+        self.max_retries = max_retries
+        self._queue: "queue.Queue[AuditEntry]" = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.dropped = 0
+        self.dead_lettered = 0
+
+    def submit(self, entries: list[AuditEntry]) -> None:
+        """Đưa nhật ký vào hàng đợi; không bao giờ chặn lâu hơn ``submit_timeout``."""
+        dropped: list[AuditEntry] = []
+        for entry in entries:
+            try:
+                if dropped:
+                    # Hàng đợi vừa đầy: không chờ thêm cho các nhật ký còn lại
+                    self._queue.put_nowait(entry)
+                else:
+                    self._queue.put(entry, timeout=self.submit_timeout)
+            except queue.Full:
+                dropped.append(entry)
+        if dropped:
+            _log_dead_letter(dropped)
+            self.dropped += len(dropped)
+            logger.error(
+                "Audit queue full, dropped %d audit log entries to the dead-letter log (%d total)",
+                len(dropped),
+                self.dropped,
+            )
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Dừng thread và ghi nốt các nhật ký còn trong hàng đợi.
+
+        Sau ``timeout`` giây mà thread chưa xong (ví dụ database treo), các
+        nhật ký chưa lấy khỏi hàng đợi được chuyển vào dead-letter log.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error("Audit writer did not finish within %s seconds", timeout)
+            leftover: list[AuditEntry] = []
+            while True:
+                try:
+                    leftover.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if leftover:
+                self._dead_letter(leftover)
+        self._thread = None
+
+    def _drain(self, batch: list[AuditEntry], timeout: float) -> None:
+        try:
+            batch.append(self._queue.get(timeout=timeout))
+        except queue.Empty:
+            return
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return
+
+    def _insert(self, batch: list[AuditEntry]) -> None:
+        from app.models.audit_log import AuditLog
+
+        with self.session_factory() as db:
+            # Một câu lệnh executemany cho cả lô
+            db.execute(insert(AuditLog), [entry.as_row() for entry in batch])
+            db.commit()
+
+    def _write(self, batch: list[AuditEntry]) -> Optional[Exception]:
+        """Ghi cả lô; trả về lỗi gặp phải (``None`` nếu thành công)."""
+        try:
+            self._insert(batch)
+        except Exception as exc:
+            logger.exception("Failed to write %d audit log entries", len(batch))
+            return exc
+        self.written += len(batch)
+        return None
+
+    def _dead_letter(self, batch: list[AuditEntry]) -> None:
+        _log_dead_letter(batch)
+        self.dead_lettered += len(batch)
+        logger.error("Moved %d audit log entries to the dead-letter log", len(batch))
+
+    def _split(self, batch: list[AuditEntry]) -> None:
+        """Ghi riêng từng nhật ký của lô bị lỗi dữ liệu, nhật ký lỗi vào dead-letter log."""
+        rejected: list[AuditEntry] = []
+        for index, entry in enumerate(batch):
+            try:
+                self._insert([entry])
+            except _DATA_ERRORS:
+                rejected.append(entry)
+            except Exception:
+                # Database không ghi được nữa: không thử tiếp từng dòng còn lại
+                logger.exception("Failed to write audit log entries one by one")
+                rejected.extend(batch[index:])
+                break
+            else:
+                self.written += 1
+        if rejected:
+            self._dead_letter(rejected)
+
+    def _run(self) -> None:
+        batch: list[AuditEntry] = []
+        failures = 0
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            stopping = self._stop.is_set()
+            if len(batch) < self.batch_size:
+                timeout = 0 if stopping else max(deadline - time.monotonic(), 0)
+                self._drain(batch, timeout)
+            due = len(batch) >= self.batch_size or time.monotonic() >= deadline
+            if batch and (due or stopping):
+                error = self._write(batch)
+                if error is None:
+                    batch, failures = [], 0
+                elif isinstance(error, _DATA_ERRORS):
+                    self._split(batch)
+                    batch, failures = [], 0
+                else:
+                    failures += 1
+                    if stopping or failures > self.max_retries:
+                        self._dead_letter(batch)
+                        batch, failures = [], 0
+                    else:
+                        self._stop.wait(self.flush_interval)
+            if due:
+                deadline = time.monotonic() + self.flush_interval
+            if stopping and not batch and self._queue.empty():
+                return
+
+
+_writer: Optional[AuditWriter] = None
+
+
+def install_audit(
+    session_factory: sessionmaker,
+    batch_size: int = 500,
+    flush_interval: float = 1.0,
+    max_queue: int = 10000,
+    submit_timeout: float = 0.1,
+    max_retries: int = 3,
+) -> AuditWriter:
+    """Gắn event vào ``session_factory`` và khởi động thread ghi nhật ký."""
+    global _writer
+    if _writer is None:
+        _writer = AuditWriter(
+            session_factory, batch_size, flush_interval, max_queue, submit_timeout, max_retries
+        )
+        event.listen(session_factory, "after_flush", _after_flush)
+        event.listen(session_factory, "after_commit", _after_commit)
+        event.listen(session_factory, "after_soft_rollback", _after_rollback)
+    _writer.start()
+    return _writer
+
+
+def shutdown_audit(timeout: Optional[float] = None) -> None:
+    """Ghi nốt hàng đợi và gỡ event; gọi khi ứng dụng tắt."""
+    global _writer
+    if _writer is None:
+        return
+    session_factory = _writer.session_factory
+    event.remove(session_factory, "after_flush", _after_flush)
+    event.remove(session_factory, "after_commit", _after_commit)
+    event.remove(session_factory, "after_soft_rollback", _after_rollback)
+    _writer.stop(timeout)
+    _writer = None
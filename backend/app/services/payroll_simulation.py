@@ -0,0 +1,174 @@
+"""Mô phỏng bảng lương toàn công ty theo bộ quy tắc tùy chọn (chỉ đọc)."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.position import Position
+from app.models.work_session import WorkSession
+from app.schemas.payroll_simulation import (
+    PayrollGroupTotal,
+    PayrollRuleSet,
+    PayrollSimulationOut,
+)
+
+
+@dataclass
+class PayrollInputs:
+    """Dữ liệu đầu vào của một tháng, mỗi phần tử ứng với một nhân viên."""
+
+    employee_ids: np.ndarray
+    department_ids: np.ndarray
+    position_ids: np.ndarray
+    base_salaries: np.ndarray
+    total_hours: np.ndarray
+
+
+@dataclass
+class PayrollResult:
+    total_hours: np.ndarray
+    overtime_hours: np.ndarray
+    base_salaries: np.ndarray
+    overtime_salaries: np.ndarray
+    total_salaries: np.ndarray
+
+
+def load_payroll_inputs(
+    db: Session, year: int, month: int, include_inactive: bool = False
+) -> PayrollInputs:
+    """Nạp lương cơ bản và tổng giờ làm trong tháng của mọi nhân viên vào mảng NumPy.
+
+    Tổng giờ được cộng dồn ngay trong database (một dòng cho mỗi nhân viên) từ
+    cột ``worked_seconds`` nằm trong index bao phủ, cùng điều kiện lọc phiên
+    chấm công với ``calculate_salary_for_employee``. Dùng ``select`` của Core
+    để không phải dựng đối tượng ORM cho từng dòng.
+    """
+    start_date = datetime(year, month, 1)
+    end_date = datetime(year, month + 1, 1) if month != 12 else datetime(year + 1, 1, 1)
+
+    employee_query = select(
+        Employee.id, Employee.department_id, Employee.position_id, Employee.base_salary
+    )
+    if not include_inactive:
+        employee_query = employee_query.where(Employee.status == "active")
+    rows = db.execute(employee_query.order_by(Employee.id)).all()
+
+    count = len(rows)
+    employee_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=count)
+    department_ids = np.fromiter((r[1] for r in rows), dtype=np.int64, count=count)
+    position_ids = np.fromiter((r[2] for r in rows), dtype=np.int64, count=count)
+    base_salaries = np.fromiter((float(r[3]) for r in rows), dtype=np.float64, count=count)
+
+    hour_rows = db.execute(
+        select(WorkSession.employee_id, func.sum(WorkSession.worked_seconds))
+        .where(WorkSession.checkin >= start_date, WorkSession.checkout < end_date)
+        .group_by(WorkSession.employee_id)
+    ).all()
+
+    total_hours = np.zeros(count, dtype=np.float64)
+    if hour_rows and count:
+        session_ids = np.fromiter((r[0] for r in hour_rows), dtype=np.int64, count=len(hour_rows))
+        session_hours = np.fromiter(
+            (float(r[1] or 0) / 3600 for r in hour_rows), dtype=np.float64, count=len(hour_rows)
+        )
+        # employee_ids đã được sắp xếp nên có thể ghép bằng searchsorted
+        idx = np.searchsorted(employee_ids, session_ids)
+        idx_clipped = np.minimum(idx, count - 1)
+        matched = employee_ids[idx_clipped] == session_ids
+        total_hours[idx_clipped[matched]] = session_hours[matched]
+
+    return PayrollInputs(
+        employee_ids=employee_ids,
+        department_ids=department_ids,
+        position_ids=position_ids,
+        base_salaries=base_salaries,
+        total_hours=total_hours,
+    )
+
+
+def apply_rules(inputs: PayrollInputs, rules: PayrollRuleSet) -> PayrollResult:
+    """Áp dụng bộ quy tắc lên toàn bộ nhân viên cùng lúc (vector hóa)."""
+    base_salaries = inputs.base_salaries
+    if rules.department_base_salary_factors:
+        dept_keys = np.fromiter(rules.department_base_salary_factors.keys(), dtype=np.int64)
+        dept_factors = np.fromiter(
+            rules.department_base_salary_factors.values(), dtype=np.float64
+        )
+        order = np.argsort(dept_keys)
+        dept_keys, dept_factors = dept_keys[order], dept_factors[order]
+        idx = np.minimum(np.searchsorted(dept_keys, inputs.department_ids), len(dept_keys) - 1)
+        factors = np.where(dept_keys[idx] == inputs.department_ids, dept_factors[idx], 1.0)
+        base_salaries = base_salaries * factors
+
+    overtime_hours = np.maximum(inputs.total_hours - rules.overtime_threshold_hours, 0.0)
+    hourly_rates = base_salaries / rules.standard_hours
+    overtime_salaries = overtime_hours * hourly_rates * rules.overtime_multiplier
+
+    return PayrollResult(
+        total_hours=inputs.total_hours,
+        overtime_hours=overtime_hours,
+        base_salaries=base_salaries,
+        overtime_salaries=overtime_salaries,
+        total_salaries=base_salaries + overtime_salaries,
+    )
+
+
+def _group_totals(
+    group_ids: np.ndarray, result: PayrollResult, names: dict[int, str]
+) -> list[PayrollGroupTotal]:
+    keys, inverse = np.unique(group_ids, return_inverse=True)
+    size = len(keys)
+    counts = np.bincount(inverse, minlength=size)
+
+    def total(values: np.ndarray) -> np.ndarray:
+        return np.bincount(inverse, weights=values, minlength=size)
+
+    hours = total(result.total_hours)
+    overtime_hours = total(result.overtime_hours)
+    base = total(result.base_salaries)
+    overtime = total(result.overtime_salaries)
+    grand = total(result.total_salaries)
+
+    return [
+        PayrollGroupTotal(
+            id=int(key),
+            name=names.get(int(key)),
+            employee_count=int(counts[i]),
+            total_hours=round(float(hours[i]), 2),
+            overtime_hours=round(float(overtime_hours[i]), 2),
+            base_salary=round(float(base[i]), 2),
+            overtime_salary=round(float(overtime[i]), 2),
+            total_salary=round(float(grand[i]), 2),
+        )
+        for i, key in enumerate(keys)
+    ]
+
+
+def simulate_payroll(
+    db: Session, year: int, month: int, rules: PayrollRuleSet
+) -> PayrollSimulationOut:
+    """Mô phỏng bảng lương tháng theo ``rules`` mà không ghi gì vào database."""
+    inputs = load_payroll_inputs(db, year, month, rules.include_inactive)
+    result = apply_rules(inputs, rules)
+
+    department_names = dict(db.query(Department.id, Department.name).all())
+    position_names = dict(db.query(Position.id, Position.name).all())
+
+    return PayrollSimulationOut(
+        year=year,
+        month=month,
+        rules=rules,
+        employee_count=int(inputs.employee_ids.size),
+        total_hours=round(float(result.total_hours.sum()), 2),
+        overtime_hours=round(float(result.overtime_hours.sum()), 2),
+        base_salary=round(float(result.base_salaries.sum()), 2),
+        overtime_salary=round(float(result.overtime_salaries.sum()), 2),
+        total_salary=round(float(result.total_salaries.sum()), 2),
+        by_department=_group_totals(inputs.department_ids, result, department_names),
+        by_position=_group_totals(inputs.position_ids, result, position_names),
+    )
@@ -33,6 +33,7 @@ CREATE TABLE employees (
     photo_url VARCHAR(255),            -- URL hình ảnh nhân viên
     account VARCHAR(100) NOT NULL,     -- Tài khoản nhân viên
     password_hash VARCHAR(255) NOT NULL,  -- Mật khẩu (băm)
+    token_version INT NOT NULL DEFAULT 0,  -- Phiên bản token (tăng khi đổi tài khoản/mật khẩu)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- Thời gian tạo
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,  -- Thời gian cập nhật
     FOREIGN KEY (department_id) REFERENCES departments(id),  -- Khóa ngoại phòng ban
@@ -45,9 +46,11 @@ CREATE TABLE work_sessions (
     employee_id INT NOT NULL,           -- Mã nhân viên (khóa ngoại)
     checkin DATETIME NOT NULL,          -- Thời gian check-in
     checkout DATETIME NOT NULL,         -- Thời gian check-out
+    worked_seconds INT AS (TIMESTAMPDIFF(SECOND, checkin, checkout)) STORED,  -- Số giây làm việc (tự tính)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- Thời gian tạo
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,  -- Thời gian cập nhật
-    FOREIGN KEY (employee_id) REFERENCES employees(id)  -- Khóa ngoại nhân viên
+    FOREIGN KEY (employee_id) REFERENCES employees(id),  -- Khóa ngoại nhân viên
+    INDEX idx_work_sessions_checkin (checkin, employee_id, checkout, worked_seconds)  -- Tổng giờ theo tháng
 );
 
 -- Tạo bảng monthly_salaries (lương tháng)
@@ -65,3 +68,15 @@ CREATE TABLE monthly_salaries (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,  -- Thời gian cập nhật
     FOREIGN KEY (employee_id) REFERENCES employees(id)  -- Khóa ngoại nhân viên
 );
+
+-- Tạo bảng audit_logs (nhật ký thay đổi, chỉ ghi thêm)
+CREATE TABLE audit_logs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    table_name VARCHAR(64) NOT NULL,  -- Bảng bị thay đổi
+    row_id INT NULL,                  -- Khóa chính của dòng bị thay đổi
+    action ENUM('create', 'update', 'delete') NOT NULL,  -- Loại thao tác
+    changes JSON NOT NULL,            -- Giá trị trước/sau của các cột thay đổi
+    occurred_at DATETIME(6) NOT NULL,  -- Thời điểm commit thay đổi
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- Thời điểm ghi nhật ký
+    INDEX idx_audit_logs_row (table_name, row_id)
+);
@@ -0,0 +1,145 @@
+"""Đo thời gian mô phỏng bảng lương (POST /api/v1/salaries/simulate).
+
+Mặc định tạo dữ liệu giả trong SQLite in-memory (``--employees`` nhân viên,
+``--sessions`` phiên chấm công mỗi người) rồi đo:
+  - load_ms: hai truy vấn DB (danh sách nhân viên, tổng giờ theo nhân viên)
+  - rules_ms: áp dụng quy tắc + tổng hợp theo phòng ban/chức vụ (NumPy)
+  - total_ms: toàn bộ ``simulate_payroll``
+
+Với ``--database-url`` (ví dụ MySQL thật) chỉ đọc dữ liệu có sẵn, không ghi gì.
+Số giây mỗi phiên được tính sẵn khi ghi (cột ``worked_seconds``) nên truy vấn
+tổng giờ chỉ đọc index bao phủ, không phải đổi DATETIME từng dòng.
+
+Ví dụ:
+    python benchmarks/payroll_simulation.py --employees 50000 --max-total-ms 1000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.models.department import Department  # noqa: E402
+from app.models.employee import Employee  # noqa: E402
+from app.models.position import Position  # noqa: E402
+from app.models.salary import Salary  # noqa: E402,F401
+from app.models.work_session import WorkSession  # noqa: E402
+from app.schemas.payroll_simulation import PayrollRuleSet  # noqa: E402
+from app.services.payroll_simulation import (  # noqa: E402
+    _group_totals,
+    apply_rules,
+    load_payroll_inputs,
+    simulate_payroll,
+)
+
+YEAR, MONTH = 2024, 3
+
+
+def seed(engine, employees: int, sessions: int, departments: int = 20, positions: int = 8) -> None:
+    Base.metadata.create_all(engine)
+    rng = random.Random(0)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Department),
+            [{"id": i, "code": f"{i:03d}", "name": f"Phòng {i}"} for i in range(1, departments + 1)],
+        )
+        conn.execute(
+            insert(Position),
+            [{"id": i, "code": chr(64 + i), "name": f"Chức vụ {i}"} for i in range(1, positions + 1)],
+        )
+        conn.execute(
+            insert(Employee),
+            [
+                {
+                    "id": i,
+                    "code": f"E{i:07d}",
+                    "name": f"Employee {i}",
+                    "department_id": rng.randint(1, departments),
+                    "position_id": rng.randint(1, positions),
+                    "base_salary": rng.randint(5_000_000, 30_000_000),
+                    "status": "active",
+                    "join_order": i,
+                    "account": f"user{i}",
+                    "password_hash": "x",
+                    "token_version": 0,
+                }
+                for i in range(1, employees + 1)
+            ],
+        )
+        start = datetime(YEAR, MONTH, 1, 8)
+        rows = []
+        for i in range(1, employees + 1):
+            for day in range(sessions):
+                checkin = start + timedelta(days=day)
+                rows.append(
+                    {
+                        "employee_id": i,
+                        "checkin": checkin,
+                        "checkout": checkin + timedelta(hours=rng.uniform(6, 11)),
+                    }
+                )
+            if len(rows) >= 100_000:
+                conn.execute(insert(WorkSession), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(WorkSession), rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--employees", type=int, default=50_000)
+    parser.add_argument("--sessions", type=int, default=22)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-total-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        engine = create_engine("sqlite://")
+        started = time.perf_counter()
+        seed(engine, args.employees, args.sessions)
+        print(f"seeded {args.employees} employees in {time.perf_counter() - started:.1f} s")
+
+    rules = PayrollRuleSet(
+        overtime_threshold_hours=160, standard_hours=160, department_base_salary_factors={3: 1.05}
+    )
+    timings: dict[str, list[float]] = {"load_ms": [], "rules_ms": [], "total_ms": []}
+    SessionLocal = sessionmaker(bind=engine)
+    with SessionLocal() as db:
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            inputs = load_payroll_inputs(db, YEAR, MONTH)
+            t1 = time.perf_counter()
+            result = apply_rules(inputs, rules)
+            _group_totals(inputs.department_ids, result, {})
+            _group_totals(inputs.position_ids, result, {})
+            t2 = time.perf_counter()
+            simulate_payroll(db, YEAR, MONTH, rules)
+            t3 = time.perf_counter()
+            timings["load_ms"].append((t1 - t0) * 1000)
+            timings["rules_ms"].append((t2 - t1) * 1000)
+            timings["total_ms"].append((t3 - t2) * 1000)
+
+    medians = {key: statistics.median(values) for key, values in timings.items()}
+    for key, value in medians.items():
+        print(f"{key:>9}: {value:8.1f} ms (median of {args.runs}, {inputs.employee_ids.size} employees)")
+
+    if args.max_total_ms is not None and medians["total_ms"] > args.max_total_ms:
+        print(f"FAIL: total_ms > {args.max_total_ms}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Đo thời gian khởi động (cold start) của backend.
+
+Mỗi lần đo chạy trong một tiến trình Python mới và báo cáo:
+  - import_ms: thời gian ``import main``
+  - first_request_ms: thời gian tới response đầu tiên (``GET /healthz``)
+  - routers_ms: thời gian nạp toàn bộ router, models và schemas
+    (``GET /openapi.json``) - chi phí chuyển sang request thật đầu tiên
+
+Ví dụ:
+    python benchmarks/startup.py --runs 5 --max-import-ms 800 --max-first-request-ms 300 \
+        --max-routers-ms 1000
+
+Trả về mã thoát 1 nếu vượt ngưỡng hoặc nếu ``import main`` kéo theo các
+module nặng (router, models, SQLAlchemy) - dấu hiệu mất lazy loading.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Các module không được import khi chỉ ``import main``
+EAGER_MODULE_PREFIXES = ("sqlalchemy", "app.api.v1.", "app.models.", "app.db.session", "jose")
+
+_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+PRELOADED = set(sys.modules)
+from fastapi.testclient import TestClient
+client = TestClient(main.app)
+t2 = time.perf_counter()
+client.get("/healthz").raise_for_status()
+t3 = time.perf_counter()
+client.get("/openapi.json").raise_for_status()
+t4 = time.perf_counter()
+eager = sorted(m for m in PRELOADED if m.startswith(PREFIXES))
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "first_request_ms": (t3 - t2) * 1000,
+    "routers_ms": (t4 - t3) * 1000,
+    "eager_modules": eager,
+}))
+"""
+
+
+def run_once() -> dict:
+    probe = f"PREFIXES = {EAGER_MODULE_PREFIXES!r}\n" + _PROBE
+    completed = subprocess.run(
+        [sys.executable, "-c", probe], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"startup probe failed:\n{completed.stderr}")
+    output = completed.stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-first-request-ms", type=float, default=None)
+    parser.add_argument("--max-routers-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+    medians = {
+        key: statistics.median(r[key] for r in results)
+        for key in ("import_ms", "first_request_ms", "routers_ms")
+    }
+    for key, value in medians.items():
+        print(f"{key:>18}: {value:8.1f} ms (median of {args.runs})")
+
+    failed = False
+    eager = results[0]["eager_modules"]
+    if eager:
+        print(f"FAIL: import main eagerly loaded: {', '.join(eager)}")
+        failed = True
+    if args.max_import_ms is not None and medians["import_ms"] > args.max_import_ms:
+        print(f"FAIL: import_ms > {args.max_import_ms}")
+        failed = True
+    if args.max_first_request_ms is not None and medians["first_request_ms"] > args.max_first_request_ms:
+        print(f"FAIL: first_request_ms > {args.max_first_request_ms}")
+        failed = True
+    if args.max_routers_ms is not None and medians["routers_ms"] > args.max_routers_ms:
+        print(f"FAIL: routers_ms > {args.max_routers_ms}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
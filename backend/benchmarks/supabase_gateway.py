@@ -0,0 +1,64 @@
+"""Đo throughput của SupabaseGateway với stand-in cục bộ (không cần Supabase thật).
+
+So sánh đọc từng dòng một request/lần với đọc có gom request (``get_row``).
+
+Ví dụ:
+    python benchmarks/supabase_gateway.py --lookups 2000 --concurrency 200 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.supabase_standin import create_standin_app, standin_gateway  # noqa: E402
+
+
+async def run(lookups: int, concurrency: int, latency: float, rows: int) -> None:
+    tables = {"employees": [{"id": i, "name": f"Employee {i}"} for i in range(1, rows + 1)]}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def measure(label: str, lookup) -> None:
+        standin = create_standin_app(tables, latency=latency)
+        gateway = standin_gateway(standin)
+
+        async def one(i: int) -> None:
+            async with semaphore:
+                row = await lookup(gateway, i % rows + 1)
+                assert row is not None
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(lookups)))
+        elapsed = time.perf_counter() - started
+        await gateway.aclose()
+        print(
+            f"{label:>10}: {lookups / elapsed:9.0f} lookups/s, "
+            f"{standin.state.request_count} upstream requests, {elapsed * 1000:.0f} ms"
+        )
+
+    async def unbatched(gateway, key):
+        rows = await gateway.select("employees", filters={"id": f"eq.{key}"})
+        return rows[0] if rows else None
+
+    async def batched(gateway, key):
+        return await gateway.get_row("employees", key)
+
+    await measure("unbatched", unbatched)
+    await measure("batched", batched)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.lookups, args.concurrency, args.latency_ms / 1000, args.rows))
+
+
+if __name__ == "__main__":
+    main()
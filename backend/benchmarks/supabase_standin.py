@@ -0,0 +1,105 @@
+"""In-process stand-in for Supabase/PostgREST, for tests and benchmarks.
+
+Chỉ hỗ trợ phần PostgREST mà ``SupabaseGateway`` dùng: ``select``, ``limit``,
+bộ lọc ``eq.``/``in.(...)`` và ``POST`` thêm dòng. Có thể gắn trực tiếp vào
+gateway qua ``httpx.ASGITransport`` (không cần mạng) hoặc chạy bằng uvicorn
+(từ thư mục backend)::
+
+    uvicorn --factory benchmarks.supabase_standin:create_standin_app --port 54321
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.supabase_gateway import SupabaseGateway
+
+_RESERVED_PARAMS = frozenset({"select", "limit", "offset", "order"})
+
+
+def _parse_in(raw: str) -> set[str]:
+    """Tách danh sách ``(a,"b,c",d)`` theo cú pháp PostgREST."""
+    values, current, quoted, escaped = set(), [], False, False
+    for ch in raw.strip()[1:-1]:
+        if escaped:
+            current.append(ch)
+            escaped = False
+        elif ch == "\\" and quoted:
+            escaped = True
+        elif ch == '"':
+            quoted = not quoted
+        elif ch == "," and not quoted:
+            values.add("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    values.add("".join(current))
+    return values
+
+
+def _predicate(column: str, expression: str):
+    operator, _, value = expression.partition(".")
+    if operator == "eq":
+        return lambda row: str(row.get(column)) == value
+    if operator == "in":
+        values = _parse_in(value)
+        return lambda row: str(row.get(column)) in values
+    raise ValueError(f"Unsupported operator: {operator}")
+
+
+def create_standin_app(
+    tables: Optional[dict[str, list[dict[str, Any]]]] = None, latency: float = 0.0
+) -> Starlette:
+    """Tạo app giả lập PostgREST; ``latency`` (giây) mô phỏng round trip mạng."""
+    data: dict[str, list[dict[str, Any]]] = tables if tables is not None else {}
+
+    async def table_endpoint(request: Request):
+        request.app.state.request_count += 1
+        if latency:
+            await asyncio.sleep(latency)
+        table = request.path_params["table"]
+        rows = data.setdefault(table, [])
+
+        if request.method == "POST":
+            payload = await request.json()
+            new_rows = payload if isinstance(payload, list) else [payload]
+            rows.extend(new_rows)
+            return JSONResponse(new_rows, status_code=201)
+
+        params = request.query_params
+        try:
+            predicates = [
+                _predicate(column, expression)
+                for column, expression in params.multi_items()
+                if column not in _RESERVED_PARAMS
+            ]
+        except ValueError as exc:
+            return JSONResponse({"message": str(exc)}, status_code=400)
+        result = [row for row in rows if all(p(row) for p in predicates)]
+
+        if "limit" in params:
+            result = result[: int(params["limit"])]
+        select = params.get("select", "*")
+        if select != "*":
+            columns = select.split(",")
+            result = [{c: row.get(c) for c in columns} for row in result]
+        return JSONResponse(result)
+
+    app = Starlette(
+        routes=[Route("/rest/v1/{table}", table_endpoint, methods=["GET", "POST"])]
+    )
+    app.state.request_count = 0
+    app.state.tables = data
+    return app
+
+
+def standin_gateway(standin: Starlette, **kwargs) -> SupabaseGateway:
+    """Gateway nối thẳng tới ``standin`` trong cùng tiến trình."""
+    return SupabaseGateway(
+        "http://supabase.standin", "standin-key", transport=httpx.ASGITransport(app=standin), **kwargs
+    )
@@ -0,0 +1,114 @@
+import json
+import logging
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.audit_log import AuditLog
+from app.services.audit import AuditEntry, AuditWriter
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    AuditLog.__table__.create(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def make_entry(row_id: int) -> AuditEntry:
+    return AuditEntry("departments", row_id, "create", {"name": {"after": "x"}}, datetime.utcnow())
+
+
+def count_rows(session_factory) -> int:
+    with session_factory() as db:
+        return db.scalar(select(func.count()).select_from(AuditLog))
+
+
+def dead_letter_rows(caplog) -> list[dict]:
+    return [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "app.audit.dead_letter"
+    ]
+
+
+def test_writes_batches_on_stop(session_factory):
+    writer = AuditWriter(session_factory, batch_size=2, flush_interval=10)
+    writer.start()
+    writer.submit([make_entry(i) for i in range(5)])
+    writer.stop(timeout=5)
+
+    assert writer.written == 5
+    assert count_rows(session_factory) == 5
+
+
+def test_dropped_entries_go_to_dead_letter_log(session_factory, caplog):
+    writer = AuditWriter(session_factory, max_queue=2, submit_timeout=0.01)
+    with caplog.at_level(logging.ERROR):
+        writer.submit([make_entry(i) for i in range(5)])
+
+    assert writer.dropped == 3
+    assert [row["row_id"] for row in dead_letter_rows(caplog)] == [2, 3, 4]
+
+
+def test_operational_error_dead_letters_whole_batch(session_factory, caplog, monkeypatch):
+    calls = []
+
+    def failing_insert(batch):
+        calls.append(len(batch))
+        raise OperationalError("INSERT", {}, Exception("server has gone away"))
+
+    writer = AuditWriter(session_factory, batch_size=10, flush_interval=0.01, max_retries=1)
+    monkeypatch.setattr(writer, "_insert", failing_insert)
+    with caplog.at_level(logging.ERROR):
+        writer.start()
+        writer.submit([make_entry(i) for i in range(4)])
+        writer.stop(timeout=5)
+
+    # Thử lại cả lô, không tách từng dòng
+    assert all(size == 4 for size in calls)
+    assert writer.dead_lettered == 4
+    assert len(dead_letter_rows(caplog)) == 4
+
+
+def test_integrity_error_splits_batch(session_factory, caplog, monkeypatch):
+    real_insert = AuditWriter._insert
+
+    def insert(self, batch):
+        if any(entry.row_id == 2 for entry in batch):
+            raise IntegrityError("INSERT", {}, Exception("constraint failed"))
+        real_insert(self, batch)
+
+    monkeypatch.setattr(AuditWriter, "_insert", insert)
+    writer = AuditWriter(session_factory, batch_size=10, flush_interval=10)
+    with caplog.at_level(logging.ERROR):
+        writer.start()
+        writer.submit([make_entry(i) for i in range(4)])
+        writer.stop(timeout=5)
+
+    assert writer.written == 3
+    assert count_rows(session_factory) == 3
+    assert [row["row_id"] for row in dead_letter_rows(caplog)] == [2]
+
+
+def test_stop_timeout_dead_letters_queued_entries(session_factory, caplog, monkeypatch):
+    release = threading.Event()
+    writer = AuditWriter(session_factory, batch_size=1, flush_interval=0.01)
+    monkeypatch.setattr(writer, "_insert", lambda batch: release.wait(5))
+    with caplog.at_level(logging.ERROR):
+        writer.start()
+        writer.submit([make_entry(i) for i in range(3)])
+        writer.stop(timeout=0.2)
+    release.set()
+
+    # Lô đang ghi dở vẫn thuộc về thread; phần còn trong hàng đợi vào dead-letter log
+    assert writer.dead_lettered == 2
+    assert [row["row_id"] for row in dead_letter_rows(caplog)] == [1, 2]
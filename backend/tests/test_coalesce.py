@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+from datetime import date
+
+import httpx
+from fastapi import Depends, FastAPI, Query
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.coalesce import SingleFlight, coalesced, data_versions
+from app.db.base import Base
+from app.db.session import SessionLocal
+from app.models import department, employee, position, salary, work_session  # noqa: F401
+
+
+class Echo(BaseModel):
+    calls: int
+    day: date
+    ids: list[int]
+
+
+def make_app(name: str, ttl: float = 0, delay: float = 0, tables=("departments",)):
+    app = FastAPI()
+    calls = {"count": 0}
+    lock = threading.Lock()
+
+    def marker():
+        return object()
+
+    @app.get("/echo")
+    @coalesced(name, Echo, tables=tables, ttl=ttl)
+    def echo(day: date, ids: list[int] = Query([]), unused: object = Depends(marker)):
+        with lock:
+            calls["count"] += 1
+            count = calls["count"]
+        time.sleep(delay)
+        return {"calls": count, "day": day, "ids": ids}
+
+    return app, calls
+
+
+def test_concurrent_identical_requests_run_handler_once():
+    app, calls = make_app("test:concurrent", delay=0.2)
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.get("/echo", params={"day": "2024-03-01"}) for _ in range(20))
+            )
+
+    responses = asyncio.run(main())
+
+    assert calls["count"] == 1
+    assert {response.text for response in responses} == {responses[0].text}
+    assert all(response.json()["calls"] == 1 for response in responses)
+
+
+def test_followers_do_not_wait_in_threadpool():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute():
+        started.set()
+        release.wait(5)
+        return b"done"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do("key", compute))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        followers = [asyncio.ensure_future(flight.do("key", compute)) for _ in range(50)]
+        await asyncio.sleep(0)
+        in_flight = flight.stats()["in_flight"]
+        release.set()
+        return in_flight, await asyncio.gather(leader, *followers)
+
+    in_flight, bodies = asyncio.run(main())
+
+    assert in_flight == 1
+    assert set(bodies) == {b"done"}
+    assert flight.stats()["executions"] == 1
+    assert flight.stats()["coalesced"] == 50
+
+
+def test_date_and_list_params_are_part_of_the_key():
+    app, calls = make_app("test:params", ttl=60)
+    client = TestClient(app)
+
+    first = client.get("/echo", params={"day": "2024-03-01", "ids": [1, 2]})
+    other_day = client.get("/echo", params={"day": "2024-03-02", "ids": [1, 2]})
+    other_ids = client.get("/echo", params={"day": "2024-03-01", "ids": [1, 3]})
+    repeated = client.get("/echo", params={"day": "2024-03-01", "ids": [1, 2]})
+
+    assert other_day.json() == {"calls": 2, "day": "2024-03-02", "ids": [1, 2]}
+    assert other_ids.json() == {"calls": 3, "day": "2024-03-01", "ids": [1, 3]}
+    assert repeated.json() == first.json()
+    assert calls["count"] == 3
+
+
+def test_commit_changes_the_key():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    app, calls = make_app("test:versions", ttl=60)
+    client = TestClient(app)
+    params = {"day": "2024-03-01"}
+
+    before = data_versions.current(("departments",))
+    client.get("/echo", params=params)
+    client.get("/echo", params=params)
+    assert calls["count"] == 1
+
+    with SessionLocal(bind=engine) as db:
+        db.add(department.Department(code="ABC", name="Phòng A"))
+        db.commit()
+
+    assert data_versions.current(("departments",)) != before
+    assert client.get("/echo", params=params).json()["calls"] == 2
+
+    # Rollback không làm đổi phiên bản dữ liệu
+    with SessionLocal(bind=engine) as db:
+        db.add(department.Department(code="DEF", name="Phòng B"))
+        db.flush()
+        db.rollback()
+    assert client.get("/echo", params=params).json()["calls"] == 2
+    engine.dispose()
@@ -0,0 +1,86 @@
+import asyncio
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.supabase_gateway import SupabaseGateway
+from benchmarks.supabase_standin import create_standin_app, standin_gateway
+
+ROWS = {"employees": [{"id": i, "name": f"Employee {i}"} for i in range(1, 11)]}
+
+
+def run_with_gateway(standin, scenario, **kwargs):
+    async def main():
+        gateway = standin_gateway(standin, **kwargs)
+        try:
+            return await scenario(gateway)
+        finally:
+            await gateway.aclose()
+
+    return asyncio.run(main())
+
+
+def test_concurrent_get_row_is_one_request():
+    standin = create_standin_app(ROWS)
+
+    async def scenario(gateway):
+        return await asyncio.gather(
+            *(gateway.get_row("employees", key) for key in (1, 2, 2, 3, 99))
+        )
+
+    rows = run_with_gateway(standin, scenario)
+
+    assert [row and row["id"] for row in rows] == [1, 2, 2, 3, None]
+    assert standin.state.request_count == 1
+
+
+def test_max_batch_size_splits_requests():
+    standin = create_standin_app(ROWS)
+
+    async def scenario(gateway):
+        return await gateway.get_rows("employees", range(1, 11))
+
+    rows = run_with_gateway(standin, scenario, max_batch_size=4)
+
+    assert [row["id"] for row in rows] == list(range(1, 11))
+    assert standin.state.request_count == 3
+
+
+def test_batches_are_separated_by_selected_columns():
+    standin = create_standin_app(ROWS)
+
+    async def scenario(gateway):
+        return await asyncio.gather(
+            gateway.get_row("employees", 1, columns="name"),
+            gateway.get_row("employees", 1),
+        )
+
+    narrow, full = run_with_gateway(standin, scenario)
+
+    assert narrow == {"name": "Employee 1", "id": 1}
+    assert full == {"id": 1, "name": "Employee 1"}
+    assert standin.state.request_count == 2
+
+
+def test_upstream_error_reaches_every_waiter():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(400, json={"message": "bad filter"})
+
+    async def main():
+        gateway = SupabaseGateway("http://supabase.test", "key", transport=httpx.MockTransport(handler))
+        try:
+            return await asyncio.gather(
+                *(gateway.get_row("employees", key) for key in (1, 2, 3)),
+                return_exceptions=True,
+            )
+        finally:
+            await gateway.aclose()
+
+    errors = asyncio.run(main())
+
+    assert all(isinstance(error, HTTPException) for error in errors)
+    assert all("bad filter" in error.detail for error in errors)
+    assert len(requests) == 1
@@ -0,0 +1,25 @@
+-- Nâng cấp database đã tạo từ phiên bản base.sql cũ.
+-- Database mới tạo từ base.sql hiện tại không cần chạy file này.
+-- Chạy lần lượt các khối còn thiếu (MySQL 8).
+
+-- Số giây làm việc tự tính và index bao phủ cho truy vấn tổng giờ theo tháng
+-- (mô phỏng bảng lương). Nếu đã tạo idx_work_sessions_checkin bản 3 cột trước
+-- đó, xóa trước: DROP INDEX idx_work_sessions_checkin ON work_sessions;
+ALTER TABLE work_sessions
+    ADD COLUMN worked_seconds INT AS (TIMESTAMPDIFF(SECOND, checkin, checkout)) STORED AFTER checkout;
+CREATE INDEX idx_work_sessions_checkin ON work_sessions (checkin, employee_id, checkout, worked_seconds);
+
+-- Bảng audit_logs (nhật ký thay đổi, chỉ ghi thêm)
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    table_name VARCHAR(64) NOT NULL,
+    row_id INT NULL,
+    action ENUM('create', 'update', 'delete') NOT NULL,
+    changes JSON NOT NULL,
+    occurred_at DATETIME(6) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_audit_logs_row (table_name, row_id)
+);
+
+-- Phiên bản token của nhân viên (bắt buộc: model Employee đọc cột này trong mọi truy vấn)
+ALTER TABLE employees ADD COLUMN token_version INT NOT NULL DEFAULT 0 AFTER password_hash;